@@ -1,3 +1,72 @@
+from decimal import Decimal
+
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from tradehub.models import Asset, Category, TransactionLog
+
+
+class AssetTransactionApiTests(TestCase):
+    """API add/remove transaction endpoints keep Asset totals and TransactionLog rows in sync"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='trader', password='secret-pass-123')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.category = Category.objects.get(slug='stocks')
+        self.asset = Asset.objects.create(user=self.user, category=self.category, name='Apple')
+        self.kwargs = {'category_slug': self.category.slug, 'asset_slug': self.asset.slug}
+
+    def add_transaction(self, transaction_type, amount, cost):
+        url = reverse('api:add_asset_transaction', kwargs=self.kwargs)
+        response = self.client.post(url, {'transaction_type': transaction_type, 'amount': amount, 'cost': cost})
+        self.asset.refresh_from_db()
+        return response
+
+    def remove_transaction(self, transaction_id):
+        url = reverse('api:remove_asset_transaction', kwargs=dict(self.kwargs, transaction_id=transaction_id))
+        response = self.client.delete(url)
+        self.asset.refresh_from_db()
+        return response
+
+    def test_buy_and_sell(self):
+        response = self.add_transaction('buy', '4', '200')
+        self.assertEqual(response.status_code, 200)
+        buy = TransactionLog.objects.get(asset=self.asset)
+        self.assertEqual(response.data['transaction']['id'], buy.id)
+        self.assertEqual(self.asset.amount, Decimal('4'))
+        self.assertEqual(self.asset.cost, Decimal('200'))
+        self.assertEqual(self.asset.ort_usd, Decimal('50'))
+
+        response = self.add_transaction('Sell', '1', '60')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.asset.amount, Decimal('3'))
+        self.assertEqual(self.asset.cost, Decimal('150'))
+        sell = self.asset.transactions.get(transaction_type='sell')
+        self.assertEqual(sell.previous_ort_usd, Decimal('50'))
+
+    def test_sell_more_than_held_is_rejected(self):
+        self.add_transaction('buy', '1', '10')
+        response = self.add_transaction('sell', '2', '30')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.asset.amount, Decimal('1'))
+        self.assertEqual(self.asset.transactions.count(), 1)
+
+    def test_remove_transaction(self):
+        self.add_transaction('buy', '2', '100')
+        self.add_transaction('buy', '3', '60')
+        first_buy = self.asset.transactions.order_by('id').first()
+
+        response = self.remove_transaction(first_buy.id)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['transaction']['id'], first_buy.id)
+        self.assertEqual(self.asset.amount, Decimal('3'))
+        self.assertEqual(self.asset.cost, Decimal('60'))
+        self.assertEqual(self.asset.ort_usd, Decimal('20'))
+        self.assertFalse(TransactionLog.objects.filter(id=first_buy.id).exists())
 
-# Create your tests here.
+    def test_remove_unknown_transaction(self):
+        response = self.remove_transaction(999999)
+        self.assertEqual(response.status_code, 404)
@@ -1,5 +1,6 @@
 from django.shortcuts import render
 from django.shortcuts import get_object_or_404
+from django.db import transaction
 
 from decimal import Decimal
 from datetime import datetime
@@ -11,7 +12,7 @@ from rest_framework.authtoken.models import Token
 from .serializers import CategoryAssetsSerializer, CategorySerializer, AssetSerializer, AssetCreateSerializer, AssetTransactionSerializer
 
 # models
-from tradehub.models import Asset, Category
+from tradehub.models import Asset, Category, TransactionLog
 from django.contrib.auth.models import User
 
 @api_view(http_method_names=['GET'])
@@ -76,7 +77,7 @@ def asset_transaction_view(request, category_slug, asset_slug, *args, **kwargs):
     if serializer.is_valid():
         try:
             # Code BUY / SELL Section
-            transcation_time= datetime.now().strftime("%d/%m/%Y")
+            transcation_date = datetime.now().date()
             transaction_type = serializer.validated_data['transaction_type'].lower()
             amount = serializer.validated_data.get('amount')
             cost = serializer.validated_data.get('cost', 0)
@@ -87,38 +88,27 @@ def asset_transaction_view(request, category_slug, asset_slug, *args, **kwargs):
             if transaction_type == 'sell' and amount > asset.amount:
                 return Response({'message': 'You cannot sell more than you have', 'status': 400}, status=400)
             elif transaction_type == 'sell' and amount <= asset.amount:
+                previous_ort_usd = asset.ort_usd
                 asset.amount -= dec_amount
                 asset.cost -= dec_amount * asset.ort_usd
-                if asset.amount <= 0:
-                    previous_ort_usd = str(asset.ort_usd)
                 asset.ort_usd = 0 if asset.amount <= 0 else asset.ort_usd
-                transcation = dict(
-                # id = len(asset.logs) + 1,
-                id = max([log.get('id') for log in asset.logs]) + 1 if len(asset.logs) > 0 else len(asset.logs) + 1,
-                transaction_type = transaction_type,
-                transcation_time=transcation_time,
-                total_amount=str(amount),
-
-                total_cost=str(cost),
-                ort_usd=str(cost / amount),
-            )
-                transcation['previous_ort_usd'] = previous_ort_usd if asset.amount <= 0 else str(asset.ort_usd)
-                asset.logs.append(transcation)
-                asset.save()
             else: # buy transcation codes.
+                previous_ort_usd = None
                 asset.amount += dec_amount
                 asset.cost += dec_cost
                 asset.ort_usd = asset.cost / asset.amount
-                transcation = dict(
-                    id = max([log.get('id') for log in asset.logs]) + 1 if len(asset.logs) > 0 else len(asset.logs) + 1,
+            with transaction.atomic():
+                asset.save()
+                log = TransactionLog.objects.create(
+                    asset=asset,
                     transaction_type=transaction_type,
-                    transcation_time=transcation_time,
-                    total_amount=str(amount),
-                    total_cost=str(cost),
-                    ort_usd=str(cost / amount),
+                    total_amount=dec_amount,
+                    total_cost=dec_cost,
+                    ort_usd=dec_cost / dec_amount,
+                    previous_ort_usd=previous_ort_usd,
+                    date=transcation_date,
                 )
-                asset.logs.append(transcation)
-                asset.save()
+            transcation = log.to_log_dict()
         except Exception as e:
             print(e)
             return Response({'message': 'An error occured while adding the transaction', 'status': 500}, status=500)
@@ -147,21 +137,23 @@ def remove_asset_transaction(request, category_slug, asset_slug, transaction_id,
     category = get_object_or_404(Category, slug=category_slug)
     asset = get_object_or_404(Asset, slug=asset_slug, category=category, user=request.user)
     try:
-        for log in asset.logs:
-            if log.get('id') == transaction_id:
-                if log.get('transaction_type') == 'sell':
-                    asset.amount += Decimal(log.get('total_amount'))
-                    asset.cost += Decimal(log.get('total_cost'))
-                    asset.ort_usd = asset.cost / asset.amount
-                elif log.get('transaction_type') == 'buy' and asset.amount - Decimal(log.get('total_amount')) < 0:
-                    return Response({'message': 'Asset Amount cant be "-"', 'status': 400}, status=400)
-                else:
-                    asset.amount -= Decimal(log.get('total_amount'))
-                    asset.cost -= Decimal(log.get('total_cost'))
-                    asset.ort_usd = Decimal(asset.cost / asset.amount) if asset.amount != 0 else 0
-                asset.logs.remove(log)
+        log = asset.transactions.filter(id=transaction_id).first()
+        if log is not None:
+            if log.transaction_type == 'sell':
+                asset.amount += log.total_amount
+                asset.cost += log.total_cost
+                asset.ort_usd = asset.cost / asset.amount
+            elif log.transaction_type == 'buy' and asset.amount - log.total_amount < 0:
+                return Response({'message': 'Asset Amount cant be "-"', 'status': 400}, status=400)
+            else:
+                asset.amount -= log.total_amount
+                asset.cost -= log.total_cost
+                asset.ort_usd = Decimal(asset.cost / asset.amount) if asset.amount != 0 else 0
+            removed = log.to_log_dict()
+            with transaction.atomic():
+                log.delete()
                 asset.save()
-                return Response({'message': 'Transaction removed successfully', 'status': 200, 'transaction':log}, status=200)
+            return Response({'message': 'Transaction removed successfully', 'status': 200, 'transaction':removed}, status=200)
     except:
         return Response({'message': 'An error occured while removing the transaction', 'status': 500}, status=500)
     return Response({'message': 'Transaction not found', 'status': 404}, status=404) # 
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Category, Asset
+from .models import Category, Asset, TransactionLog
 
 # Register your models here.
 
@@ -12,4 +12,10 @@ class CategoryAdmin(admin.ModelAdmin):
 @admin.register(Asset)
 class AssetAdmin(admin.ModelAdmin):
     list_display = ['id', 'category','name','slug','amount','cost','ort_usd','user']
-    list_display_links = ['id', 'category','name','slug','amount','cost','ort_usd','user']
\ No newline at end of file
+    list_display_links = ['id', 'category','name','slug','amount','cost','ort_usd','user']
+
+@admin.register(TransactionLog)
+class TransactionLogAdmin(admin.ModelAdmin):
+    list_display = ['id', 'asset', 'transaction_type', 'total_amount', 'total_cost', 'ort_usd', 'date']
+    list_display_links = ['id', 'asset']
+    list_select_related = ['asset__user']
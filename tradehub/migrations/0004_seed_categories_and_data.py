@@ -1,8 +1,130 @@
-from django.db import migrations
+from django.db import migrations, transaction
 from django.contrib.auth.hashers import make_password
-from django.contrib.auth.models import User
+from django.utils.text import slugify
 from decimal import Decimal
-import datetime
+
+
+_DEMO_USER_DEFAULTS = {
+    'email': 'demo@example.com',
+    'first_name': 'Demo',
+    'last_name': 'User',
+}
+
+# (slug, name) pairs for the default categories
+_CATEGORIES = [
+    ('crypto', 'Cryptocurrency'),
+    ('stocks', 'Stocks'),
+    ('bonds', 'Bonds'),
+    ('real-estate', 'Real Estate'),
+]
+
+# Demo portfolio; amounts are built as Decimals once at import time
+_ASSETS_DATA = [
+    # Cryptocurrency assets
+    {
+        'name': 'Bitcoin',
+        'category_slug': 'crypto',
+        'amount': Decimal('0.40'),
+        'cost': Decimal('15000.00'),
+        'ort_usd': Decimal('37500.00'),
+        'logs': [
+            {'type': 'buy', 'quantity': '0.40', 'price': '37500.00', 'date': '2025-06-15'},
+        ]
+    },
+    {
+        'name': 'Ethereum',
+        'category_slug': 'crypto',
+        'amount': Decimal('5.00'),
+        'cost': Decimal('11250.00'),
+        'ort_usd': Decimal('17250.00'),
+        'logs': [
+            {'type': 'buy', 'quantity': '5.00', 'price': '2250.00', 'date': '2025-07-10'},
+        ]
+    },
+    {
+        'name': 'Cardano',
+        'category_slug': 'crypto',
+        'amount': Decimal('1500.00'),
+        'cost': Decimal('750.00'),
+        'ort_usd': Decimal('1425.00'),
+        'logs': [
+            {'type': 'buy', 'quantity': '1500.00', 'price': '0.50', 'date': '2025-08-20'},
+        ]
+    },
+    # Stock assets
+    {
+        'name': 'Apple Inc.',
+        'category_slug': 'stocks',
+        'amount': Decimal('50.00'),
+        'cost': Decimal('7500.00'),
+        'ort_usd': Decimal('9787.50'),
+        'logs': [
+            {'type': 'buy', 'quantity': '50.00', 'price': '150.00', 'date': '2024-03-01'},
+        ]
+    },
+    {
+        'name': 'Microsoft Corporation',
+        'category_slug': 'stocks',
+        'amount': Decimal('30.00'),
+        'cost': Decimal('9300.00'),
+        'ort_usd': Decimal('13065.00'),
+        'logs': [
+            {'type': 'buy', 'quantity': '30.00', 'price': '310.00', 'date': '2024-05-10'},
+        ]
+    },
+    {
+        'name': 'Tesla Inc.',
+        'category_slug': 'stocks',
+        'amount': Decimal('20.00'),
+        'cost': Decimal('4900.00'),
+        'ort_usd': Decimal('5706.00'),
+        'logs': [
+            {'type': 'buy', 'quantity': '20.00', 'price': '245.00', 'date': '2024-07-15'},
+        ]
+    },
+    {
+        'name': 'Alphabet Inc.',
+        'category_slug': 'stocks',
+        'amount': Decimal('15.00'),
+        'cost': Decimal('2100.00'),
+        'ort_usd': Decimal('2736.00'),
+        'logs': [
+            {'type': 'buy', 'quantity': '15.00', 'price': '140.00', 'date': '2024-09-22'},
+        ]
+    },
+    # Bond assets
+    {
+        'name': 'US Treasury Bond 10Y',
+        'category_slug': 'bonds',
+        'amount': Decimal('10000.00'),
+        'cost': Decimal('10000.00'),
+        'ort_usd': Decimal('10200.00'),
+        'logs': [
+            {'type': 'buy', 'quantity': '10000.00', 'price': '1.00', 'date': '2024-01-15'},
+        ]
+    },
+    {
+        'name': 'IBM Corporate Bond',
+        'category_slug': 'bonds',
+        'amount': Decimal('5000.00'),
+        'cost': Decimal('5000.00'),
+        'ort_usd': Decimal('4900.00'),
+        'logs': [
+            {'type': 'buy', 'quantity': '5000.00', 'price': '1.00', 'date': '2024-02-28'},
+        ]
+    },
+    # Real Estate asset
+    {
+        'name': 'Realty Income Corp REITs',
+        'category_slug': 'real-estate',
+        'amount': Decimal('200.00'),
+        'cost': Decimal('13100.00'),
+        'ort_usd': Decimal('15840.00'),
+        'logs': [
+            {'type': 'buy', 'quantity': '200.00', 'price': '65.50', 'date': '2024-04-10'},
+        ]
+    },
+]
 
 
 def seed_data(apps, schema_editor):
@@ -13,178 +135,79 @@ def seed_data(apps, schema_editor):
     Category = apps.get_model('tradehub', 'Category')
     Asset = apps.get_model('tradehub', 'Asset')
     User = apps.get_model('auth', 'User')
+    db_alias = schema_editor.connection.alias
 
-    # Create categories if they don't exist
-    categories = {
-        'crypto': Category.objects.get_or_create(
-            slug='crypto',
-            defaults={'name': 'Cryptocurrency'}
-        )[0],
-        'stocks': Category.objects.get_or_create(
-            slug='stocks',
-            defaults={'name': 'Stocks'}
-        )[0],
-        'bonds': Category.objects.get_or_create(
-            slug='bonds',
-            defaults={'name': 'Bonds'}
-        )[0],
-        'real-estate': Category.objects.get_or_create(
-            slug='real-estate',
-            defaults={'name': 'Real Estate'}
-        )[0],
-    }
-
-    # Create demo user if doesn't exist
-    demo_user, created = User.objects.get_or_create(
-        username='demo',
-        defaults={
-            'email': 'demo@example.com',
-            'first_name': 'Demo',
-            'last_name': 'User',
-            'password': make_password('demo123456'),  # Hash password here
-        }
-    )
-
-    # Seed assets only if none exist
-    if Asset.objects.filter(user=demo_user).exists():
-        return  # Don't duplicate data
+    with transaction.atomic(using=db_alias):
+        # Create categories if they don't exist, then fetch them all in one query
+        Category.objects.using(db_alias).bulk_create(
+            [Category(slug=slug, name=name) for slug, name in _CATEGORIES],
+            ignore_conflicts=True,
+        )
+        categories = Category.objects.using(db_alias).in_bulk(
+            [slug for slug, _ in _CATEGORIES],
+            field_name='slug',
+        )
 
-    # Cryptocurrency assets
-    assets_data = [
-        {
-            'name': 'Bitcoin',
-            'category_slug': 'crypto',
-            'amount': '0.40',
-            'cost': '15000.00',
-            'ort_usd': '37500.00',
-            'logs': [
-                {'type': 'buy', 'quantity': '0.40', 'price': '37500.00', 'date': '2025-06-15'},
-            ]
-        },
-        {
-            'name': 'Ethereum',
-            'category_slug': 'crypto',
-            'amount': '5.00',
-            'cost': '11250.00',
-            'ort_usd': '17250.00',
-            'logs': [
-                {'type': 'buy', 'quantity': '5.00', 'price': '2250.00', 'date': '2025-07-10'},
-            ]
-        },
-        {
-            'name': 'Cardano',
-            'category_slug': 'crypto',
-            'amount': '1500.00',
-            'cost': '750.00',
-            'ort_usd': '1425.00',
-            'logs': [
-                {'type': 'buy', 'quantity': '1500.00', 'price': '0.50', 'date': '2025-08-20'},
-            ]
-        },
-        # Stock assets
-        {
-            'name': 'Apple Inc.',
-            'category_slug': 'stocks',
-            'amount': '50.00',
-            'cost': '7500.00',
-            'ort_usd': '9787.50',
-            'logs': [
-                {'type': 'buy', 'quantity': '50.00', 'price': '150.00', 'date': '2024-03-01'},
-            ]
-        },
-        {
-            'name': 'Microsoft Corporation',
-            'category_slug': 'stocks',
-            'amount': '30.00',
-            'cost': '9300.00',
-            'ort_usd': '13065.00',
-            'logs': [
-                {'type': 'buy', 'quantity': '30.00', 'price': '310.00', 'date': '2024-05-10'},
-            ]
-        },
-        {
-            'name': 'Tesla Inc.',
-            'category_slug': 'stocks',
-            'amount': '20.00',
-            'cost': '4900.00',
-            'ort_usd': '5706.00',
-            'logs': [
-                {'type': 'buy', 'quantity': '20.00', 'price': '245.00', 'date': '2024-07-15'},
-            ]
-        },
-        {
-            'name': 'Alphabet Inc.',
-            'category_slug': 'stocks',
-            'amount': '15.00',
-            'cost': '2100.00',
-            'ort_usd': '2736.00',
-            'logs': [
-                {'type': 'buy', 'quantity': '15.00', 'price': '140.00', 'date': '2024-09-22'},
-            ]
-        },
-        # Bond assets
-        {
-            'name': 'US Treasury Bond 10Y',
-            'category_slug': 'bonds',
-            'amount': '10000.00',
-            'cost': '10000.00',
-            'ort_usd': '10200.00',
-            'logs': [
-                {'type': 'buy', 'quantity': '10000.00', 'price': '1.00', 'date': '2024-01-15'},
-            ]
-        },
-        {
-            'name': 'IBM Corporate Bond',
-            'category_slug': 'bonds',
-            'amount': '5000.00',
-            'cost': '5000.00',
-            'ort_usd': '4900.00',
-            'logs': [
-                {'type': 'buy', 'quantity': '5000.00', 'price': '1.00', 'date': '2024-02-28'},
-            ]
-        },
-        # Real Estate asset
-        {
-            'name': 'Realty Income Corp REITs',
-            'category_slug': 'real-estate',
-            'amount': '200.00',
-            'cost': '13100.00',
-            'ort_usd': '15840.00',
-            'logs': [
-                {'type': 'buy', 'quantity': '200.00', 'price': '65.50', 'date': '2024-04-10'},
-            ]
-        },
-    ]
+        # Create demo user if doesn't exist
+        demo_user, created = User.objects.using(db_alias).get_or_create(
+            username='demo',
+            defaults=_DEMO_USER_DEFAULTS,
+        )
+        if created:
+            # Only pay for the password hash when the user is actually new.
+            # Historical models have no set_password(), so hash it directly.
+            demo_user.password = make_password('demo123456')
+            demo_user.save(update_fields=['password'])
 
-    # Create assets
-    for asset_data in assets_data:
-        category = categories[asset_data['category_slug']]
-        logs = asset_data.pop('logs', [])
-        category_slug = asset_data.pop('category_slug')
-        
-        # Skip if asset already exists for this user
-        if Asset.objects.filter(
-            user=demo_user,
-            name=asset_data['name'],
-            category=category
-        ).exists():
-            continue
-        
-        # Create a simple slug from name (autoslug will regenerate on save in real usage)
-        simple_slug = asset_data['name'].lower().replace(' ', '-')[:30]
-        
-        # Create asset (convert string amounts to Decimal)
-        Asset.objects.create(
-            user=demo_user,
-            category=category,
-            name=asset_data['name'],
-            amount=Decimal(asset_data['amount']),
-            cost=Decimal(asset_data['cost']),
-            ort_usd=Decimal(asset_data['ort_usd']),
-            logs=logs,  # logs is JSON-safe with string values
-            slug=simple_slug,
+        # Fetch the demo user's existing (name, category) pairs once so the
+        # loop below can skip them without a query per asset
+        existing = set(
+            Asset.objects.using(db_alias).filter(user=demo_user).values_list('name', 'category_id')
         )
 
+        # Point autoslug's uniqueness check at this database too; the historical
+        # model class is private to this migration run, so this doesn't leak
+        Asset._meta.get_field('slug').manager = Asset._default_manager.db_manager(db_alias)
+
+        # Create the missing assets in a single INSERT
+        to_create = []
+        for index, asset_data in enumerate(_ASSETS_DATA):
+            category = categories[asset_data['category_slug']]
+
+            # Skip if asset already exists for this user
+            if (asset_data['name'], category.id) in existing:
+                continue
+
+            # Copy the log entries so the saved instances never alias _ASSETS_DATA
+            logs = [dict(log) for log in asset_data['logs']]
+
+            # Supply the slug up front so AutoSlugField keeps it instead of calling
+            # generate_random_slug; the index suffix keeps seed slugs unique
+            simple_slug = f"{slugify(asset_data['name'])[:30]}-{index}"
+
+            to_create.append(Asset(
+                user=demo_user,
+                category=category,
+                name=asset_data['name'],
+                amount=asset_data['amount'],
+                cost=asset_data['cost'],
+                ort_usd=asset_data['ort_usd'],
+                logs=logs,  # logs is JSON-safe with string values
+                slug=simple_slug,
+            ))
+
+        if to_create:
+            # Seed slugs are controlled values: check them all in one query and, when
+            # none are taken, skip autoslug's per-row "does this slug exist?" SELECT
+            slug_field = Asset._meta.get_field('slug')
+            slug_field._unique = Asset.objects.using(db_alias).filter(
+                slug__in=[asset.slug for asset in to_create]
+            ).exists()
+            try:
+                Asset.objects.using(db_alias).bulk_create(to_create, ignore_conflicts=True, batch_size=500)
+            finally:
+                slug_field._unique = True
+
 
 def reverse_seed(apps, schema_editor):
     """
@@ -193,17 +216,18 @@ def reverse_seed(apps, schema_editor):
     User = apps.get_model('auth', 'User')
     Asset = apps.get_model('tradehub', 'Asset')
     Category = apps.get_model('tradehub', 'Category')
+    db_alias = schema_editor.connection.alias
     
     # Remove demo user and associated assets
     try:
-        demo_user = User.objects.get(username='demo')
-        Asset.objects.filter(user=demo_user).delete()
+        demo_user = User.objects.using(db_alias).get(username='demo')
+        Asset.objects.using(db_alias).filter(user=demo_user).delete()
         demo_user.delete()
     except User.DoesNotExist:
         pass
     
     # Remove categories (optional—comment out to keep categories)
-    # Category.objects.filter(slug__in=['crypto', 'stocks', 'bonds', 'real-estate']).delete()
+    # Category.objects.using(db_alias).filter(slug__in=['crypto', 'stocks', 'bonds', 'real-estate']).delete()
 
 
 class Migration(migrations.Migration):
@@ -213,5 +237,5 @@ class Migration(migrations.Migration):
     ]
 
     operations = [
-        migrations.RunPython(seed_data, reverse_seed),
+        migrations.RunPython(seed_data, reverse_seed, atomic=True),
     ]
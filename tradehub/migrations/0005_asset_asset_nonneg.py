@@ -0,0 +1,39 @@
+# Generated by Django 5.1.6 on 2026-10-15 09:12
+
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+def normalize_negative_values(apps, schema_editor):
+    """
+    Clears negative values the same way Asset.save() does, so existing
+    rows satisfy the asset_nonneg constraint added below.
+    """
+    Asset = apps.get_model('tradehub', 'Asset')
+    assets = Asset.objects.using(schema_editor.connection.alias)
+    zero = Decimal('0')
+
+    assets.filter(amount__lte=0).update(amount=zero, cost=zero, ort_usd=zero)
+    assets.filter(cost__lt=0).update(cost=zero)
+    assets.filter(ort_usd__lt=0).update(ort_usd=zero)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tradehub", "0004_seed_categories_and_data"),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_negative_values, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="asset",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("amount__gte", 0), ("cost__gte", 0), ("ort_usd__gte", 0)
+                ),
+                name="asset_nonneg",
+            ),
+        ),
+    ]
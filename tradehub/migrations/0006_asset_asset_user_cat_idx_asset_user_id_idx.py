@@ -0,0 +1,25 @@
+# Generated by Django 5.1.6 on 2026-10-15 09:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tradehub", "0005_asset_asset_nonneg"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="asset",
+            index=models.Index(
+                fields=["user", "category"], name="asset_user_cat_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="asset",
+            index=models.Index(fields=["user", "-id"], name="asset_user_id_idx"),
+        ),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.1.6 on 2026-10-15 11:05
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tradehub", "0006_asset_asset_user_cat_idx_asset_user_id_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TransactionLog",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "transaction_type",
+                    models.CharField(
+                        choices=[("buy", "buy"), ("sell", "sell")],
+                        help_text="Transaction type (buy or sell)",
+                        max_length=4,
+                    ),
+                ),
+                (
+                    "total_amount",
+                    models.DecimalField(
+                        decimal_places=10,
+                        help_text="Quantity bought or sold",
+                        max_digits=50,
+                    ),
+                ),
+                (
+                    "total_cost",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=Decimal("0"),
+                        help_text="Total price in USD",
+                        max_digits=100,
+                    ),
+                ),
+                (
+                    "ort_usd",
+                    models.DecimalField(
+                        decimal_places=10,
+                        default=Decimal("0"),
+                        help_text="Price per unit in USD",
+                        max_digits=100,
+                    ),
+                ),
+                (
+                    "previous_ort_usd",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=10,
+                        help_text="Asset average cost before a sell (used to undo it)",
+                        max_digits=100,
+                        null=True,
+                    ),
+                ),
+                ("date", models.DateField(help_text="Transaction date")),
+                (
+                    "asset",
+                    models.ForeignKey(
+                        help_text="Asset this transaction belongs to",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="transactions",
+                        to="tradehub.asset",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Transaction Log",
+                "verbose_name_plural": "Transaction Logs",
+                "ordering": ["id"],
+                "indexes": [
+                    models.Index(
+                        fields=["asset", "date"], name="txlog_asset_date_idx"
+                    )
+                ],
+            },
+        ),
+    ]
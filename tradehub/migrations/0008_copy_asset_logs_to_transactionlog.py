@@ -0,0 +1,101 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from django.db import migrations, transaction
+
+
+_BATCH_SIZE = 500
+
+
+def _parse_date(log):
+    """
+    Read the transaction date from either log format.
+    Views stored 'transcation_time' as dd/mm/YYYY, the seed data used ISO 'date'.
+    """
+    if log.get('transcation_time'):
+        return datetime.strptime(log['transcation_time'], "%d/%m/%Y").date()
+    if log.get('date'):
+        return date.fromisoformat(log['date'])
+    return date.today()
+
+
+def copy_logs(apps, schema_editor):
+    """
+    Expands every Asset.logs JSON list into TransactionLog rows.
+    """
+    Asset = apps.get_model('tradehub', 'Asset')
+    TransactionLog = apps.get_model('tradehub', 'TransactionLog')
+    db_alias = schema_editor.connection.alias
+
+    with transaction.atomic(using=db_alias):
+        to_create = []
+        for asset in Asset.objects.using(db_alias).only('id', 'logs').iterator():
+            for log in asset.logs or []:
+                # Entries without a buy/sell type can't be replayed; leave them out
+                transaction_type = log.get('transaction_type') or log.get('type')
+                if transaction_type not in ('buy', 'sell'):
+                    continue
+
+                # View logs use total_amount/ort_usd, seed logs use quantity/price
+                total_amount = Decimal(log.get('total_amount') or log.get('quantity') or '0')
+                ort_usd = Decimal(log.get('ort_usd') or log.get('price') or '0')
+                total_cost = log.get('total_cost')
+                previous_ort_usd = log.get('previous_ort_usd')
+                to_create.append(TransactionLog(
+                    asset_id=asset.id,
+                    transaction_type=transaction_type,
+                    total_amount=total_amount,
+                    total_cost=Decimal(total_cost) if total_cost is not None else total_amount * ort_usd,
+                    ort_usd=ort_usd,
+                    previous_ort_usd=Decimal(previous_ort_usd) if previous_ort_usd is not None else None,
+                    date=_parse_date(log),
+                ))
+
+                # Flush in batches so memory stays bounded alongside .iterator()
+                if len(to_create) >= _BATCH_SIZE:
+                    TransactionLog.objects.using(db_alias).bulk_create(to_create)
+                    to_create = []
+
+        if to_create:
+            TransactionLog.objects.using(db_alias).bulk_create(to_create)
+
+
+def restore_logs(apps, schema_editor):
+    """
+    Rebuilds Asset.logs from TransactionLog rows on reverse migration.
+    """
+    Asset = apps.get_model('tradehub', 'Asset')
+    TransactionLog = apps.get_model('tradehub', 'TransactionLog')
+    db_alias = schema_editor.connection.alias
+
+    logs_by_asset = {}
+    for log in TransactionLog.objects.using(db_alias).order_by('id').iterator():
+        entries = logs_by_asset.setdefault(log.asset_id, [])
+        entry = dict(
+            id=len(entries) + 1,
+            transaction_type=log.transaction_type,
+            transcation_time=log.date.strftime("%d/%m/%Y"),
+            total_amount=str(log.total_amount),
+            total_cost=str(log.total_cost),
+            ort_usd=str(log.ort_usd),
+        )
+        if log.previous_ort_usd is not None:
+            entry['previous_ort_usd'] = str(log.previous_ort_usd)
+        entries.append(entry)
+
+    assets = list(Asset.objects.using(db_alias).filter(id__in=logs_by_asset).only('id'))
+    for asset in assets:
+        asset.logs = logs_by_asset[asset.id]
+    Asset.objects.using(db_alias).bulk_update(assets, ['logs'], batch_size=_BATCH_SIZE)
+    TransactionLog.objects.using(db_alias).all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tradehub', '0007_transactionlog'),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_logs, restore_logs),
+    ]
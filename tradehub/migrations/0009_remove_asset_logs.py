@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-15 11:07
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tradehub", "0008_copy_asset_logs_to_transactionlog"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="asset",
+            name="logs",
+        ),
+    ]
@@ -4,6 +4,7 @@ Models for the TradeHub application.
 This module defines the core data models for portfolio management:
 - Category: Asset categories (Cryptocurrency, Stocks, Bonds, etc.)
 - Asset: Individual assets owned by users with transaction logs
+- TransactionLog: Individual buy/sell transactions of an asset
 """
 
 from django.db import models
@@ -11,12 +12,17 @@ from django.contrib.auth.models import User
 from django.urls import reverse
 
 import string
-import random
+from random import choices
 from decimal import Decimal, ROUND_HALF_UP
 
 from autoslug import AutoSlugField
 
 
+_ZERO = Decimal('0')
+_HUNDRED = Decimal(100)
+_SLUG_ALPHABET = string.ascii_lowercase
+
+
 class Category(models.Model):
     """
     Asset Category Model
@@ -52,12 +58,23 @@ class Category(models.Model):
         return reverse('tradehub:asset_category', kwargs={'asset_category_slug': self.slug})
 
 
+class AssetManager(models.Manager):
+    """
+    Default Asset manager
+
+    Joins the owning user and category into every query so listings that
+    render ``asset.user``/``asset.category`` don't issue a query per row.
+    """
+    def get_queryset(self):
+        return super().get_queryset().select_related('user', 'category')
+
+
 class Asset(models.Model):
     """
     Asset Model - Represents individual investments owned by users
     
     Each asset belongs to a user and category. Tracks amount held, cost basis,
-    current USD value, and maintains a JSON log of all buy/sell transactions.
+    current USD value; buy/sell transactions are stored as TransactionLog rows.
     
     Attributes:
         user (ForeignKey): User who owns this asset
@@ -67,7 +84,6 @@ class Asset(models.Model):
         amount (Decimal): Current quantity held (after all transactions)
         cost (Decimal): Total cost basis in USD
         ort_usd (Decimal): Current market value in USD
-        logs (JSONField): Transaction history [{'type': 'buy'|'sell', 'amount': X, ...}]
     """
     
     user = models.ForeignKey(
@@ -111,18 +127,23 @@ class Asset(models.Model):
         default=Decimal('0'),
         help_text="Current market value in USD (ORT = average price)"
     )
-    logs = models.JSONField(
-        null=True,
-        blank=True,
-        default=list,
-        help_text="JSON array of transaction logs with buy/sell records"
-    )
+    objects = AssetManager()
 
     class Meta:
         verbose_name = "Asset"
         verbose_name_plural = "Assets"
         ordering = ['-id']
         unique_together = ('user', 'name', 'category')
+        indexes = [
+            models.Index(fields=['user', 'category'], name='asset_user_cat_idx'),
+            models.Index(fields=['user', '-id'], name='asset_user_id_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(amount__gte=0) & models.Q(cost__gte=0) & models.Q(ort_usd__gte=0),
+                name='asset_nonneg',
+            ),
+        ]
 
     def __str__(self):
         """String representation showing user and asset name"""
@@ -130,35 +151,18 @@ class Asset(models.Model):
 
     def save(self, *args, **kwargs):
         """
-        Custom save method to handle data validation and normalization
-        
-        - Converts None values to Decimal('0')
-        - Ensures amount and cost are never negative
-        - Initializes logs if empty
-        - Prevents invalid state combinations
-        """
-        # Handle None values by converting to Decimal('0')
-        if self.amount is None:
-            self.amount = Decimal('0')
-        if self.cost is None:
-            self.cost = Decimal('0')
-        if self.ort_usd is None:
-            self.ort_usd = Decimal('0')
-            
-        # Normalize negative or zero amounts
-        if self.amount <= 0:
-            self.amount = Decimal('0')
-            self.ort_usd = Decimal('0')
-            self.cost = Decimal('0')
-        
-        # Ensure cost is never negative
-        elif self.cost < 0:
-            self.cost = Decimal('0')
+        Normalize the position before writing it
+
+        - Zeroes amount, cost and ort_usd once everything has been sold
+        - Clamps cost (and ort_usd derived from it) so they never go negative
 
-        # Initialize transaction counters if logs are empty
-        if self.logs is None or len(self.logs) < 1:
-            self.buy_count = 0
-            self.sell_count = 0
+        Non-negative values are enforced by the ``asset_nonneg`` check constraint.
+        """
+        if self.amount <= _ZERO:
+            self.amount = self.cost = self.ort_usd = _ZERO
+        elif self.cost < _ZERO:
+            self.cost = _ZERO
+            self.ort_usd = max(self.ort_usd, _ZERO)
 
         super(Asset, self).save(*args, **kwargs)
 
@@ -172,8 +176,7 @@ class Asset(models.Model):
         Returns:
             str: Random 15-character string of lowercase letters
         """
-        letters = string.ascii_lowercase
-        return ''.join(random.choice(letters) for i in range(15))
+        return ''.join(choices(_SLUG_ALPHABET, k=15))
 
     def get_absolute_url(self):
         """Get the URL for this asset's detail/transaction log page"""
@@ -192,14 +195,28 @@ class Asset(models.Model):
     @property
     def gain_loss(self):
         """Calculate gain/loss in USD (current value - cost basis)"""
-        return self.current_value - self.total_invested
+        return self.ort_usd - self.cost
 
     @property
     def gain_loss_percentage(self):
         """Calculate gain/loss as percentage"""
-        if self.total_invested == 0:
-            return Decimal('0')
-        return (self.gain_loss / self.total_invested * 100)
+        cost = self.cost
+        if cost == _ZERO:
+            return _ZERO
+        return (self.ort_usd - cost) / cost * _HUNDRED
+
+    @property
+    def logs(self):
+        """
+        Transaction history in the old JSON log format (deprecated)
+
+        Kept for one release for code that still reads ``asset.logs``;
+        use ``asset.transactions`` instead.
+
+        Returns:
+            list: One dict per transaction, oldest first
+        """
+        return [log.to_log_dict() for log in self.transactions.all()]
 
 
     def get_absolute_url(self):
@@ -208,4 +225,91 @@ class Asset(models.Model):
 
 
     # COİN JSON -> {'İşlem: (buy or sell)','COİN Adeti:', 'TOTAL PARA:', 'KUR:', 'USD KARŞILIĞI:'}
-    # HİSSE JSON -> {'İşlem: (buy or sell)','LOT Adeti:', 'TOTAL PARA:', 'KUR':,  'USD KARŞILIĞI:'}
\ No newline at end of file
+    # HİSSE JSON -> {'İşlem: (buy or sell)','LOT Adeti:', 'TOTAL PARA:', 'KUR':,  'USD KARŞILIĞI:'}
+
+
+class TransactionLog(models.Model):
+    """
+    Transaction Log Model - A single buy or sell of an asset
+
+    Attributes:
+        asset (ForeignKey): Asset this transaction belongs to
+        transaction_type (str): 'buy' or 'sell'
+        total_amount (Decimal): Quantity bought or sold
+        total_cost (Decimal): Total price paid/received in USD
+        ort_usd (Decimal): Price per unit in USD (total_cost / total_amount)
+        previous_ort_usd (Decimal): Asset's average cost at the time of a sell
+        date (date): Day the transaction was made
+    """
+    TRANSACTION_TYPES = [('buy', 'buy'), ('sell', 'sell')]
+
+    asset = models.ForeignKey(
+        Asset,
+        on_delete=models.CASCADE,
+        related_name='transactions',
+        help_text="Asset this transaction belongs to"
+    )
+    transaction_type = models.CharField(
+        max_length=4,
+        choices=TRANSACTION_TYPES,
+        help_text="Transaction type (buy or sell)"
+    )
+    total_amount = models.DecimalField(
+        max_digits=50,
+        decimal_places=10,
+        help_text="Quantity bought or sold"
+    )
+    total_cost = models.DecimalField(
+        max_digits=100,
+        decimal_places=2,
+        default=Decimal('0'),
+        help_text="Total price in USD"
+    )
+    ort_usd = models.DecimalField(
+        max_digits=100,
+        decimal_places=10,
+        default=Decimal('0'),
+        help_text="Price per unit in USD"
+    )
+    previous_ort_usd = models.DecimalField(
+        max_digits=100,
+        decimal_places=10,
+        null=True,
+        blank=True,
+        help_text="Asset average cost before a sell (used to undo it)"
+    )
+    date = models.DateField(
+        help_text="Transaction date"
+    )
+
+    class Meta:
+        verbose_name = "Transaction Log"
+        verbose_name_plural = "Transaction Logs"
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['asset', 'date'], name='txlog_asset_date_idx'),
+        ]
+
+    def __str__(self):
+        """String representation showing asset and transaction type"""
+        return f"{self.asset.name} - {self.transaction_type} {self.total_amount}"
+
+    def to_log_dict(self):
+        """
+        Serialize this transaction in the old JSON log format
+
+        Returns:
+            dict: {'id', 'transaction_type', 'transcation_time', 'total_amount',
+                   'total_cost', 'ort_usd'[, 'previous_ort_usd']}
+        """
+        log = dict(
+            id=self.id,
+            transaction_type=self.transaction_type,
+            transcation_time=self.date.strftime("%d/%m/%Y"),
+            total_amount=str(self.total_amount),
+            total_cost=str(self.total_cost),
+            ort_usd=str(self.ort_usd),
+        )
+        if self.previous_ort_usd is not None:
+            log['previous_ort_usd'] = str(self.previous_ort_usd)
+        return log
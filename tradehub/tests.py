@@ -1,3 +1,188 @@
-from django.test import TestCase
+import json
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from django.urls import reverse
+
+from .models import Asset, Category, TransactionLog
+
+
+class AssetTransactionViewTests(TestCase):
+    """Web buy/sell/delete views keep Asset totals and TransactionLog rows in sync"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='trader', password='secret-pass-123')
+        self.client.force_login(self.user)
+        self.category = Category.objects.get(slug='crypto')
+        self.asset = Asset.objects.create(user=self.user, category=self.category, name='Bitcoin')
+
+    def add_transaction(self, transaction_type, total_amount, total_cost):
+        url = reverse('tradehub:add_new_asset_transcation', kwargs={'asset_slug': self.asset.slug})
+        response = self.client.post(url, {
+            'transaction_type': transaction_type,
+            'total_amount': total_amount,
+            'total_cost': total_cost,
+        })
+        self.assertEqual(response.status_code, 302)
+        self.asset.refresh_from_db()
+
+    def delete_transactions(self, ids):
+        url = reverse('tradehub:delete_an_asset_transcation', kwargs={'asset_slug': self.asset.slug})
+        response = self.client.post(url, data=json.dumps(ids), content_type='application/json')
+        self.asset.refresh_from_db()
+        return response
+
+    def test_buy_and_sell_update_asset_and_logs(self):
+        self.add_transaction('buy', '2', '100')
+        self.assertEqual(self.asset.amount, Decimal('2'))
+        self.assertEqual(self.asset.cost, Decimal('100'))
+        self.assertEqual(self.asset.ort_usd, Decimal('50'))
+
+        self.add_transaction('sell', '1', '70')
+        self.assertEqual(self.asset.amount, Decimal('1'))
+        self.assertEqual(self.asset.cost, Decimal('50'))
+
+        logs = list(self.asset.transactions.all())
+        self.assertEqual([log.transaction_type for log in logs], ['buy', 'sell'])
+        self.assertEqual(logs[1].previous_ort_usd, Decimal('50'))
+
+    def test_delete_sell_restores_position(self):
+        self.add_transaction('buy', '2', '100')
+        self.add_transaction('sell', '2', '120')
+        self.assertEqual(self.asset.amount, Decimal('0'))
+
+        sell = self.asset.transactions.get(transaction_type='sell')
+        response = self.delete_transactions([sell.id])
+        self.assertEqual(response.json(), {'success': 'True'})
+        self.assertEqual(self.asset.amount, Decimal('2'))
+        self.assertEqual(self.asset.cost, Decimal('100'))
+        self.assertFalse(TransactionLog.objects.filter(id=sell.id).exists())
+
+    def test_delete_buy_after_partial_sell_clamps_negative_cost(self):
+        self.add_transaction('buy', '1', '1000')
+        self.add_transaction('buy', '2', '2')
+        self.add_transaction('sell', '1', '1')
+        first_buy = self.asset.transactions.order_by('id').first()
+
+        response = self.delete_transactions([first_buy.id])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.asset.amount, Decimal('1'))
+        self.assertEqual(self.asset.cost, Decimal('0'))
+        self.assertEqual(self.asset.ort_usd, Decimal('0'))
+        self.assertEqual(self.asset.transactions.count(), 2)
+
+    def test_delete_buy_below_zero_is_rejected(self):
+        self.add_transaction('buy', '1', '10')
+        self.add_transaction('sell', '1', '12')
+        buy = self.asset.transactions.get(transaction_type='buy')
+
+        response = self.delete_transactions([buy.id])
+        self.assertEqual(response.json(), {'message': 'Amount cant be "-"'})
+        self.assertEqual(self.asset.transactions.count(), 2)
+
+    def test_delete_sell_and_its_buy_in_selection_order(self):
+        self.add_transaction('buy', '1', '10')
+        self.add_transaction('sell', '1', '12')
+        buy = self.asset.transactions.get(transaction_type='buy')
+        sell = self.asset.transactions.get(transaction_type='sell')
+
+        response = self.delete_transactions([sell.id, buy.id])
+        self.assertEqual(response.json(), {'success': 'True'})
+        self.assertEqual(self.asset.amount, Decimal('0'))
+        self.assertEqual(self.asset.cost, Decimal('0'))
+        self.assertFalse(self.asset.transactions.exists())
+
+
+class AssetLogsShimTests(TestCase):
+    """Asset.logs returns TransactionLog rows in the old JSON log format"""
+
+    def test_logs_property(self):
+        user = User.objects.create_user(username='trader', password='secret-pass-123')
+        asset = Asset.objects.create(user=user, category=Category.objects.get(slug='stocks'), name='Apple')
+        log = TransactionLog.objects.create(
+            asset=asset,
+            transaction_type='buy',
+            total_amount=Decimal('3'),
+            total_cost=Decimal('30'),
+            ort_usd=Decimal('10'),
+            date='2024-05-01',
+        )
+        self.assertEqual(asset.logs, [{
+            'id': log.id,
+            'transaction_type': 'buy',
+            'transcation_time': '01/05/2024',
+            'total_amount': '3.0000000000',
+            'total_cost': '30.00',
+            'ort_usd': '10.0000000000',
+        }])
+
+
+class CopyAssetLogsMigrationTests(TransactionTestCase):
+    """0008 moves Asset.logs JSON into TransactionLog rows and back"""
+
+    before = [('tradehub', '0007_transactionlog')]
+    after = [('tradehub', '0008_copy_asset_logs_to_transactionlog')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def setUp(self):
+        apps = self.migrate(self.before)
+        User = apps.get_model('auth', 'User')
+        Asset = apps.get_model('tradehub', 'Asset')
+        Category = apps.get_model('tradehub', 'Category')
+
+        user = User.objects.create(username='trader')
+        category = Category.objects.get(slug='crypto')
+        self.view_asset = Asset.objects.create(user=user, category=category, name='Viewcoin', slug='viewcoin', logs=[
+            {'id': 1, 'transaction_type': 'buy', 'transcation_time': '03/02/2024',
+             'total_amount': '2', 'total_cost': '100', 'ort_usd': '50'},
+            {'id': 2, 'transaction_type': 'sell', 'transcation_time': '04/02/2024',
+             'total_amount': '1', 'total_cost': '70', 'ort_usd': '70', 'previous_ort_usd': '50'},
+            {'id': 3, 'total_amount': '5'},
+        ])
+        self.seed_asset = Asset.objects.create(user=user, category=category, name='Seedcoin', slug='seedcoin', logs=[
+            {'type': 'buy', 'quantity': '4.00', 'price': '2.50', 'date': '2024-06-15'},
+        ])
+
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def test_copy_and_restore_logs(self):
+        apps = self.migrate(self.after)
+        TransactionLog = apps.get_model('tradehub', 'TransactionLog')
+
+        view_logs = list(TransactionLog.objects.filter(asset_id=self.view_asset.id).order_by('id'))
+        self.assertEqual([log.transaction_type for log in view_logs], ['buy', 'sell'])
+        self.assertEqual(str(view_logs[0].date), '2024-02-03')
+        self.assertEqual(view_logs[0].total_cost, Decimal('100'))
+        self.assertIsNone(view_logs[0].previous_ort_usd)
+        self.assertEqual(view_logs[1].previous_ort_usd, Decimal('50'))
+
+        seed_log = TransactionLog.objects.get(asset_id=self.seed_asset.id)
+        self.assertEqual(seed_log.transaction_type, 'buy')
+        self.assertEqual(seed_log.total_amount, Decimal('4'))
+        self.assertEqual(seed_log.ort_usd, Decimal('2.5'))
+        self.assertEqual(seed_log.total_cost, Decimal('10'))
+        self.assertEqual(str(seed_log.date), '2024-06-15')
+
+        apps = self.migrate(self.before)
+        Asset = apps.get_model('tradehub', 'Asset')
+        self.assertFalse(apps.get_model('tradehub', 'TransactionLog').objects.exists())
+
+        view_logs = Asset.objects.get(id=self.view_asset.id).logs
+        self.assertEqual([log['transaction_type'] for log in view_logs], ['buy', 'sell'])
+        self.assertEqual(view_logs[1]['transcation_time'], '04/02/2024')
+        self.assertEqual(Decimal(view_logs[1]['previous_ort_usd']), Decimal('50'))
+
+        seed_logs = Asset.objects.get(id=self.seed_asset.id).logs
+        self.assertEqual(len(seed_logs), 1)
+        self.assertEqual(seed_logs[0]['transcation_time'], '15/06/2024')
+        self.assertEqual(Decimal(seed_logs[0]['total_cost']), Decimal('10'))
 
-# Create your tests here.
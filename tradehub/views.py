@@ -4,9 +4,10 @@ from django.core.paginator import Paginator
 from django.contrib import messages
 from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
+from django.db import transaction
 
 #models
-from .models import Asset, Category
+from .models import Asset, Category, TransactionLog
 
 #modelForms
 from .forms import AssetForm, AssetTranscationForm
@@ -67,13 +68,13 @@ def add_new_asset(request, asset_category_slug):
 @login_required(login_url='account:login')
 def asset_logs(request, asset_slug):
     asset = get_object_or_404(Asset, slug=asset_slug, user=request.user)
-    all_logs = asset.logs[::-1] # all asset transcation logs
+    all_logs = asset.transactions.order_by('-id') # all asset transcation logs
     paginator = Paginator(all_logs, 10)
     page_number = request.GET.get('page')
     if page_number == 1:
         return redirect('tradehub:asset_logs', asset_slug=asset_slug)
     logs = paginator.get_page(page_number)
-    data = [cost['ort_usd'] for cost in logs if cost.get('transaction_type') == 'buy'][::-1]
+    data = [str(log.ort_usd) for log in logs if log.transaction_type == 'buy'][::-1]
     labels = [index +1 for index, label in enumerate(data)]
     context = dict(asset=asset, logs=logs, category=asset.category.name, data=data, labels=labels)
     return render(request, 'tradehub/asset.html', context=context)
@@ -86,7 +87,7 @@ def add_new_asset_transcation(request, asset_slug):
     form = AssetTranscationForm(request.POST or None)
     asset = get_object_or_404(Asset, slug=asset_slug, user=request.user)
     if form.is_valid():
-        transcation_time= datetime.now().strftime("%d/%m/%Y")
+        transcation_date = datetime.now().date()
         total_amount=form.cleaned_data.get('total_amount')
         total_cost = form.cleaned_data.get('total_cost')
         transaction_type = form.cleaned_data.get('transaction_type')
@@ -100,39 +101,26 @@ def add_new_asset_transcation(request, asset_slug):
             messages.error(request, 'Sell amount exceeds available amount. Check and try again.')
             return redirect('tradehub:add_new_asset_transcation', asset_slug=asset_slug)
         elif transaction_type == 'sell' and total_amount <= asset.amount:
+            previous_ort_usd = asset.ort_usd
             asset.amount -= dec_total_amount
             asset.cost -= dec_total_amount * asset.ort_usd
-            if asset.amount <= 0:
-                previous_ort_usd = str(asset.ort_usd)
             asset.ort_usd = 0 if asset.amount <= 0 else asset.ort_usd
-            transcation = dict(
-            # id = len(asset.logs) + 1,
-            id = max([log.get('id') for log in asset.logs]) + 1 if len(asset.logs) > 0 else len(asset.logs) + 1,
-            transaction_type = transaction_type,
-            transcation_time=transcation_time,
-            total_amount=str(total_amount),
-
-            total_cost=str(total_cost),
-            ort_usd=str(total_cost / total_amount),
-        )
-            transcation['previous_ort_usd'] = previous_ort_usd if asset.amount <= 0 else str(asset.ort_usd)
-            asset.logs.append(transcation)
-            asset.save()
         else: # buy transcation codes.
+            previous_ort_usd = None
             asset.amount += dec_total_amount
             asset.cost += dec_total_cost
             asset.ort_usd = asset.cost / asset.amount
-            transcation = dict(
-                # id = len(asset.logs) + 1,
-                id = max([log.get('id') for log in asset.logs]) + 1 if len(asset.logs) > 0 else len(asset.logs) + 1,
+        with transaction.atomic():
+            asset.save()
+            TransactionLog.objects.create(
+                asset=asset,
                 transaction_type=transaction_type,
-                transcation_time=transcation_time,
-                total_amount=str(total_amount),
-                total_cost=str(total_cost),
-                ort_usd=str(total_cost / total_amount),
+                total_amount=dec_total_amount,
+                total_cost=dec_total_cost,
+                ort_usd=dec_total_cost / dec_total_amount,
+                previous_ort_usd=previous_ort_usd,
+                date=transcation_date,
             )
-            asset.logs.append(transcation)
-            asset.save()
         return redirect('tradehub:asset_logs', asset_slug=asset_slug)
     context = dict(form=form, asset=asset, category=asset.category.name)
     return render(request, 'tradehub/addNewAssetTranscation.html', context=context)
@@ -141,27 +129,24 @@ def add_new_asset_transcation(request, asset_slug):
 def delete_asset_transcation(request, asset_slug):
     if request.method == "POST":
         asset = get_object_or_404(Asset, slug=asset_slug, user=request.user)
-        items_to_delete = json.loads(request.body)
-        print(items_to_delete)
-        if len(items_to_delete) >= 1:
-            for item in items_to_delete:  # items_to_delete includes ids that selected by user before clicked on delete logs button
-                for index, log in enumerate(asset.logs):
-                    if int(log.get('id')) == int(item):
-                        if log.get('transaction_type') == 'sell':
-                            asset.amount += Decimal(log.get('total_amount'))
-                            asset.cost += Decimal(log.get('total_amount')) * Decimal(log.get('previous_ort_usd'))
-                            asset.ort_usd = Decimal(asset.cost / asset.amount) if asset.amount != 0 else 0
-                            asset.logs.pop(index)
-                        elif log.get('transaction_type') == 'buy':
-                            if asset.amount - Decimal(log.get('total_amount')) < 0:
-                                # messages.error(request, 'Amount cant be "-"')
-                                # return redirect('tradehub:asset_logs', asset_slug=asset_slug)
-                                return JsonResponse({'message': 'Amount cant be "-"'})
-                            else:
-                                asset.amount -= Decimal(log.get('total_amount'))
-                                asset.cost -= Decimal(log.get('total_cost'))
-                                asset.ort_usd = Decimal(asset.cost / asset.amount) if asset.amount != 0 else 0
-                                asset.logs.pop(index)
-                        break
-        asset.save()
+        items_to_delete = json.loads(request.body)  # ids selected by user before clicked on delete logs button
+        ids = [int(item) for item in items_to_delete]
+        logs = asset.transactions.in_bulk(ids)
+        for log_id in ids:  # apply in the order the user selected them, like the old log list did
+            log = logs.pop(log_id, None)
+            if log is None:
+                continue
+            if log.transaction_type == 'sell':
+                asset.amount += log.total_amount
+                asset.cost += log.total_amount * log.previous_ort_usd
+                asset.ort_usd = Decimal(asset.cost / asset.amount) if asset.amount != 0 else 0
+            elif log.transaction_type == 'buy':
+                if asset.amount - log.total_amount < 0:
+                    return JsonResponse({'message': 'Amount cant be "-"'})
+                asset.amount -= log.total_amount
+                asset.cost -= log.total_cost
+                asset.ort_usd = Decimal(asset.cost / asset.amount) if asset.amount != 0 else 0
+        with transaction.atomic():
+            asset.transactions.filter(id__in=ids).delete()
+            asset.save()
         return JsonResponse({'success':'True'})